@@ -1,48 +1,173 @@
+import contextlib
 import datetime
-import heapq
+import io
+import itertools
+import mmap
+import operator
 import os
-from collections import deque
-
+import struct
+import sys
+import time
+from array import array
+from collections import defaultdict, deque, namedtuple
+from typing import NamedTuple
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; plain Python fallbacks are defined below
+    njit = None
+
+# Layout of one on-disk ledger record: timestamp in nanoseconds (int64), product ID
+# (uint32), description (32 bytes of UTF-8, NUL padded) and quantity change (int32).
+_DESC_BYTES = 32
+_REC = struct.Struct(f'<qI{_DESC_BYTES}si')
+# display_ledger writes this many rows per stdout call, so output memory stays bounded
+_LEDGER_CHUNK_ROWS = 1024
+
+
+class TxnRecord(NamedTuple):
+    """A single ledger entry. A tuple underneath, so it's small and fields load by index."""
+    timestamp_ns: int
+    product_id: int
+    description: str
+    quantity_change: int
 
 
 class TransactionLedger:
    
-    def __init__(self):
-        self.transactions = []
+    def __init__(self, log_path=None, initial_capacity=1024, history=100):
+        """Keeps transactions in memory, or appends them to log_path if one is given.
+
+        In memory, room for `initial_capacity` transactions is set aside up front.
+        With a log file, the file is the full record and only the last `history`
+        transactions are kept in memory.
+        """
+        self.log_path = log_path
+        if log_path is None:
+            # Pre-sized list; only the first _size slots are filled in
+            self._buf = [None] * max(initial_capacity, 1)
+            self._size = 0
+            self._log = None
+        else:
+            # Unbuffered, so every record reaches the OS as soon as it is written
+            self._log = open(log_path, "ab", buffering=0)
+            # Start with the newest records already in the file
+            self._recent = deque(self._iter_log(last=history), maxlen=history)
+
+    @property
+    def transactions(self):
+        """Transactions held in memory, oldest first, as a list of TxnRecords.
+
+        With a log file, that's only the last `history` of them; the file has the rest.
+        """
+        if self.log_path is not None:
+            return list(self._recent)
+        return self._buf[:self._size]
+
+    def close(self):
+        """Closes the log file, if there is one."""
+        if self._log is not None:
+            self._log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def check_record(self, product_id, quantity_change):
+        """Raises OverflowError if a transaction couldn't be written to the log file.
+
+        The file stores the product ID as unsigned and the quantity change as signed
+        32-bit numbers. An in-memory ledger has no such limits and accepts anything.
+        """
+        if self._log is None:
+            return
+        if not 0 <= product_id < 2**32:
+            raise OverflowError(f"Product ID {product_id} is out of range for the ledger file.")
+        if not -2**31 <= quantity_change < 2**31:
+            raise OverflowError(f"Quantity change {quantity_change} is out of range for the ledger file.")
 
     def add_transaction(self, product_id, description, quantity_change):
-        """Adds a new transaction record to the ledger."""
-        transaction_record = {
-            "timestamp": datetime.datetime.now(),
-            "product_id": product_id,
-            "description": description,
-            "quantity_change": quantity_change
-        }
-        self.transactions.append(transaction_record)
+        """Adds a new transaction record to the ledger.
+
+        Raises OverflowError, without recording anything, if check_record rejects it.
+        """
+        self.check_record(product_id, quantity_change)
+        # A raw integer clock reading; it's only turned into a date when the ledger is shown
+        timestamp_ns = time.time_ns()
+        if self._log is None:
+            if self._size == len(self._buf):
+                # Full, so double the capacity
+                self._buf.extend([None] * self._size)
+            self._buf[self._size] = TxnRecord(timestamp_ns, product_id, description, quantity_change)
+            self._size += 1
+        else:
+            encoded = description.encode()
+            if len(encoded) > _DESC_BYTES:
+                # Cut down to the field size without splitting a multi-byte character
+                encoded = encoded[:_DESC_BYTES].decode(errors="ignore").encode()
+            self._log.write(_REC.pack(timestamp_ns, product_id, encoded, quantity_change))
+            self._recent.append(TxnRecord(timestamp_ns, product_id, description, quantity_change))
+
+    def _iter_log(self, last=None):
+        """Yields TxnRecords from the log file, oldest first, decoded straight off an mmap.
+
+        With `last`, only the final `last` records are read.
+        """
+        with open(self.log_path, "rb") as f:
+            # Ignore a partly written record left at the end by a crash
+            count = os.fstat(f.fileno()).st_size // _REC.size
+            first = 0 if last is None else max(count - last, 0)
+            if first == count:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)[first * _REC.size:count * _REC.size]
+                records = _REC.iter_unpack(view)
+                try:
+                    for timestamp_ns, product_id, description, quantity_change in records:
+                        yield TxnRecord(timestamp_ns, product_id, description.rstrip(b"\0").decode(), quantity_change)
+                finally:
+                    # The mmap can't be closed while anything still points into it
+                    del records
+                    view.release()
 
     def display_ledger(self):
         """Prints a formatted report of all transactions."""
         print("\n--- Transaction Ledger ---")
-        if not self.transactions:
+        # With a log file, rows are streamed from the file rather than loaded all at once
+        rows = self._iter_log() if self.log_path is not None else itertools.islice(self._buf, self._size)
+        first_row = next(rows, None)
+        if first_row is None:
             print("No transactions recorded yet.")
             return
 
         # Header for the report
         header = f"{'Timestamp':<26} {'Product ID':<12} {'Description':<20} {'Quantity Change'}"
-        print(header)
-        print("-" * len(header))
+        lines = [header, "-" * len(header)]
 
-        # Print each transaction record
-        for record in self.transactions:
+        # Rows are written in chunks: few stdout calls, without holding the whole report
+        fromtimestamp = datetime.datetime.fromtimestamp
+        for timestamp_ns, product_id, description, quantity_change in itertools.chain((first_row,), rows):
             # Format the timestamp to be more readable
-            ts_str = record['timestamp'].strftime('%Y-%m-%d %H:%M:%S')
+            ts_str = fromtimestamp(timestamp_ns / 1e9).strftime('%Y-%m-%d %H:%M:%S')
             # The :+ format specifier adds a + sign for positive numbers
-            print(f"{ts_str:<26} {record['product_id']:<12} {record['description']:<20} {record['quantity_change']:+}")
+            lines.append(f"{ts_str:<26} {product_id:<12} {description:<20} {quantity_change:+}")
+            if len(lines) >= _LEDGER_CHUNK_ROWS:
+                lines.append("")
+                sys.stdout.write("\n".join(lines))
+                lines = []
+        if lines:
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
 
 
 
 
-INVENTORY = [
+# A read-only view of one inventory row, built from the columns below.
+Product = namedtuple("Product", ["product_id", "name", "category", "price", "stock"])
+
+INITIAL_INVENTORY = [
     [101, "Gaming Mouse", "Electronics", 75.50, 80],
     [102, "Mechanical Keyboard", "Electronics", 120.00, 50],
     [103, "Webcam", "Electronics", 90.00, 60],
@@ -51,66 +176,266 @@ INVENTORY = [
     [901, "Gamer PC Bundle", "Composite", 0, 10]
 ]
 
+# The inventory is stored column-wise: position i in every column is the same product.
+# Reports that only need price and stock can then walk just those two arrays.
+PRODUCT_IDS = []
+NAMES = []
+CATEGORIES = []
+PRICES = array('d')
+STOCK = array('q')
+
+# Categories are also kept as small integer codes so totals can be summed per category
+# in a tight loop. CATEGORY_NAMES[code] gives the name back, and CATEGORY_POSITIONS[code]
+# lists where that category's products sit, for category-filtered reports.
+CATEGORY_CODES = array('q')
+CATEGORY_NAMES = []
+CATEGORY_POSITIONS = []
+_CATEGORY_CODE_BY_NAME = {}
+
+# Maps product ID -> position in the columns so lookups don't scan them.
+INVENTORY_INDEX = {}
+# Returned by lookups when a product doesn't exist; compare with `is`.
+_MISSING = object()
+
+def _append_product(product_id, name, category, price, stock):
+    """Adds a product to the end of every inventory column and indexes it."""
+    # There are only a handful of categories, so share one string object per name
+    category = sys.intern(category)
+    # The typed columns go first: they are the ones that can reject a value (e.g. a stock
+    # level too big for int64), and if they do, no other column has been touched yet.
+    STOCK.append(stock)
+    try:
+        PRICES.append(price)
+    except (TypeError, OverflowError):
+        STOCK.pop()
+        raise
+    INVENTORY_INDEX[product_id] = len(PRODUCT_IDS)
+    PRODUCT_IDS.append(product_id)
+    NAMES.append(name)
+    CATEGORIES.append(category)
+    code = _CATEGORY_CODE_BY_NAME.get(category)
+    if code is None:
+        code = _CATEGORY_CODE_BY_NAME[category] = len(CATEGORY_NAMES)
+        CATEGORY_NAMES.append(category)
+        CATEGORY_POSITIONS.append([])
+    CATEGORY_POSITIONS[code].append(len(CATEGORY_CODES))
+    CATEGORY_CODES.append(code)
+
+for row in INITIAL_INVENTORY:
+    _append_product(*row)
+
+_NEXT_ID = max(PRODUCT_IDS) + 1
+
+# Aggregation kernels over the price/stock columns. With Numba installed these are
+# compiled to machine code, which matters once the catalog reaches thousands of SKUs.
+if njit is not None:
+    @njit(cache=True)
+    def _total_value(prices, stock):
+        """Returns the sum of price * stock over every product."""
+        total = 0.0
+        for i in range(len(prices)):
+            total += prices[i] * stock[i]
+        return total
+
+    @njit(cache=True)
+    def _category_totals(category_codes, prices, stock, out):
+        """Adds each product's stock value into out[] at its category code."""
+        for i in range(len(prices)):
+            out[category_codes[i]] += prices[i] * stock[i]
+else:
+    def _total_value(prices, stock):
+        """Returns the sum of price * stock over every product."""
+        return sum(map(operator.mul, prices, stock))
+
+    def _category_totals(category_codes, prices, stock, out):
+        """Adds each product's stock value into out[] at its category code."""
+        for code, price, units in zip(category_codes, prices, stock):
+            out[code] += price * units
+
 COMPOSITE_PRODUCTS = {
     901: [101, 102, 103]  # Gamer PC Bundle parts
 }
 
 
-ledger = TransactionLedger() 
+LEDGER_PATH = None  # Set to a file path to keep a persistent, append-only ledger
+ledger = TransactionLedger(LEDGER_PATH)
 order_queue = deque()
-backorder_queue = []
-delivery_truck = [] # A stack is just a list with append/pop
+_order_ids = itertools.count(1)  # Unique, increasing order IDs
+# Backorders are grouped into a few urgency tiers (0 = most urgent) instead of a heap,
+# so pushing and popping are both constant time.
+BACKORDER_TIERS = 3
+backorder_buckets = [deque() for _ in range(BACKORDER_TIERS)]
+_min_backorder_tier = BACKORDER_TIERS  # No tier below this one has anything in it
+delivery_truck = deque() # Used as a stack (append/pop); popleft is there if we unload oldest-first
 
 
-for product in INVENTORY:
-    ledger.add_transaction(product[0], "initial stock", product[4])
+# A ledger file that already has records was seeded on an earlier run
+if LEDGER_PATH is None or os.path.getsize(LEDGER_PATH) == 0:
+    for product_id, stock in zip(PRODUCT_IDS, STOCK):
+        ledger.add_transaction(product_id, "initial stock", stock)
 
 
+if os.name == 'nt':
+    # Running an empty command once turns on ANSI escape handling in the Windows console
+    os.system('')
+
+# False when commands are piped in from a file or script rather than typed
+_INTERACTIVE = sys.stdin.isatty()
+
 def _clear_screen():
     """Clears the console screen for a cleaner UI."""
-    # A simple, practical helper function a developer would write.
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # ANSI "clear screen" + "cursor home", instead of starting a cls/clear process every time
+    sys.stdout.write('\033[2J\033[H')
+    sys.stdout.flush()
+
+def _product_at(index):
+    """Builds a Product view of the row at the given column position."""
+    return Product(PRODUCT_IDS[index], NAMES[index], CATEGORIES[index], PRICES[index], STOCK[index])
 
 def _get_product_by_id(product_id):
-    """Finds and returns a product from the inventory."""
-    # This avoids repeating the same 'for' loop everywhere.
-    for product in INVENTORY:
-        if product[0] == product_id:
-            return product
+    """Finds and returns a product from the inventory, or _MISSING if there isn't one."""
+    index = INVENTORY_INDEX.get(product_id, _MISSING)
+    if index is _MISSING:
+        return _MISSING
+    return _product_at(index)
+
+def _get_products_by_category(category):
+    """Returns every product in a category, without scanning the whole inventory."""
+    code = _CATEGORY_CODE_BY_NAME.get(category)
+    if code is None:
+        return []
+    return [_product_at(index) for index in CATEGORY_POSITIONS[code]]
+
+def _backorder_tier(quantity, stock):
+    """Ranks a backorder by how much of it is missing; small shortfalls come first."""
+    shortfall = (quantity - stock) / max(quantity, 1)
+    return min(int(shortfall * BACKORDER_TIERS), BACKORDER_TIERS - 1)
+
+def _push_backorder(order, tier):
+    """Adds an order to the back of its urgency tier."""
+    global _min_backorder_tier
+    backorder_buckets[tier].append(order)
+    if tier < _min_backorder_tier:
+        _min_backorder_tier = tier
+
+def _pop_backorder():
+    """Removes and returns the oldest order in the most urgent tier, or None if empty."""
+    global _min_backorder_tier
+    while _min_backorder_tier < BACKORDER_TIERS:
+        bucket = backorder_buckets[_min_backorder_tier]
+        if bucket:
+            return bucket.popleft()
+        _min_backorder_tier += 1
     return None
 
 def _pause():
     """Pauses the program and waits for the user to press Enter."""
+    # Piped input has no one to wait for, and the pause would swallow the next command
+    if not _INTERACTIVE:
+        return
     input("\nPress Enter to continue...")
 
+@contextlib.contextmanager
+def _block_buffered_stdout():
+    """Collects everything printed inside the block and writes it to stdout in one call."""
+    real_stdout = sys.stdout
+    sys.stdout = buffer = io.StringIO()
+    try:
+        yield
+    finally:
+        sys.stdout = real_stdout
+        real_stdout.write(buffer.getvalue())
+
+
 
 
+# The report layout never changes, so build the header and row formatter once
+_REPORT_HEADER = f"{'ID':<5} {'Product Name':<25} {'Category':<15} {'Price':>10} {'Stock':>10}"
+_REPORT_SEP = "-" * len(_REPORT_HEADER)
+_ROW_FMT = "{:<5} {:<25} {:<15} {:>10.2f} {:>10}".format
 
 def generate_inventory_report():
     """Generates and prints a report of the current inventory status."""
-    print("--- Current Inventory Report ---")
-    header = f"{'ID':<5} {'Product Name':<25} {'Category':<15} {'Price':>10} {'Stock':>10}"
-    print(header)
-    print("-" * len(header))
-    
-    total_value = sum(p[3] * p[4] for p in INVENTORY)
-    
-    for product_id, name, category, price, stock in INVENTORY:
-        print(f"{product_id:<5} {name:<25} {category:<15} {price:>10.2f} {stock:>10}")
-        
-    print("-" * len(header))
-    print(f"Total inventory value: ${total_value:,.2f}")
+    # Print the report into a buffer so it reaches the terminal as a single write
+    with _block_buffered_stdout():
+        print("--- Current Inventory Report ---")
+        print(_REPORT_HEADER)
+        print(_REPORT_SEP)
+
+        total_value = _total_value(PRICES, STOCK)
+
+        for row in zip(PRODUCT_IDS, NAMES, CATEGORIES, PRICES, STOCK):
+            print(_ROW_FMT(*row))
+
+        print(_REPORT_SEP)
+        print(f"Total inventory value: ${total_value:,.2f}")
+
+        # Stock value subtotals per category, one line each after the overall total
+        category_values = array('d', [0.0]) * len(CATEGORY_NAMES)
+        _category_totals(CATEGORY_CODES, PRICES, STOCK, category_values)
+        print("\nValue by category:")
+        for category, value in zip(CATEGORY_NAMES, category_values):
+            print(f"  {category:<15} ${value:>12,.2f}")
+
+def _leaf_price(product_id):
+    """Returns the unit price of a single (non-composite) product."""
+    index = INVENTORY_INDEX.get(product_id, _MISSING)
+    return PRICES[index] if index is not _MISSING else 0
+
+class CompositeCycleError(Exception):
+    """Raised when COMPOSITE_PRODUCTS has a bundle that (indirectly) contains itself."""
+
+
+# Cost of every composite product, filled in by _rebuild_composite_costs().
+_composite_cost_cache = {}
+
+def _rebuild_composite_costs():
+    """Recomputes every composite product's cost bottom-up, without recursion.
+
+    Call this whenever prices or COMPOSITE_PRODUCTS change so the costs aren't stale.
+    """
+    # Topological sort (Kahn's algorithm): a bundle is ready once all of its
+    # composite parts have been costed.
+    pending = {}
+    used_by = defaultdict(list)
+    for product_id, parts in COMPOSITE_PRODUCTS.items():
+        pending[product_id] = 0
+        for part_id in parts:
+            if part_id in COMPOSITE_PRODUCTS:
+                pending[product_id] += 1
+                used_by[part_id].append(product_id)
+
+    ready = deque(product_id for product_id, count in pending.items() if count == 0)
+    costs = {}
+    while ready:
+        product_id = ready.popleft()
+        costs[product_id] = sum(
+            costs[part_id] if part_id in COMPOSITE_PRODUCTS else _leaf_price(part_id)
+            for part_id in COMPOSITE_PRODUCTS[product_id]
+        )
+        for parent_id in used_by[product_id]:
+            pending[parent_id] -= 1
+            if pending[parent_id] == 0:
+                ready.append(parent_id)
+
+    if len(costs) != len(COMPOSITE_PRODUCTS):
+        raise CompositeCycleError("Composite products contain a cycle.")
+
+    _composite_cost_cache.clear()
+    _composite_cost_cache.update(costs)
+
+_rebuild_composite_costs()
 
 def calculate_composite_cost(product_id):
-    """Recursively calculates the total cost of a composite product."""
+    """Returns the total cost of a composite product (or the price of a single one)."""
     if product_id not in COMPOSITE_PRODUCTS:
-        product = _get_product_by_id(product_id)
-        return product[3] if product else 0
+        return _leaf_price(product_id)
 
-    return sum(calculate_composite_cost(part_id) for part_id in COMPOSITE_PRODUCTS[product_id])
+    return _composite_cost_cache[product_id]
 
 def add_new_product():
     """Adds a new product to the inventory system."""
+    global _NEXT_ID
     print("--- Add New Product ---")
     try:
         name = input("Enter product name: ")
@@ -118,17 +443,25 @@ def add_new_product():
         price = float(input("Enter price: "))
         stock = int(input("Enter initial stock level: "))
 
-        # Get the next available ID
-        new_id = max(p[0] for p in INVENTORY) + 1
-        
-        new_product = [new_id, name, category, price, stock]
-        INVENTORY.append(new_product)
+        # Get the next available ID; it's only used up once the product is stored
+        new_id = _NEXT_ID
+        # Check the ledger will take the entry before storing anything, so a stock level
+        # that's too large leaves neither a product nor a ledger entry behind
+        ledger.check_record(new_id, stock)
+        _append_product(new_id, name, category, price, stock)
         ledger.add_transaction(new_id, "initial stock", stock)
-        
-        print(f"\nSuccessfully added '{name}' with Product ID: {new_id}")
+        _NEXT_ID += 1
 
     except ValueError:
         print("Invalid input. Please enter numbers for price and stock.")
+        return
+    except OverflowError:
+        print("Invalid input. Stock level is too large.")
+        return
+
+    _rebuild_composite_costs()
+    
+    print(f"\nSuccessfully added '{name}' with Product ID: {new_id}")
 
 def place_order():
     """Places a new customer order into the appropriate queue."""
@@ -136,83 +469,122 @@ def place_order():
     try:
         product_id = int(input("Enter product ID to order: "))
         product = _get_product_by_id(product_id)
-        if not product:
+        if product is _MISSING:
             print("Error: Product not found.")
             return
 
-        quantity = int(input(f"Enter quantity for '{product[1]}': "))
+        quantity = int(input(f"Enter quantity for '{product.name}': "))
         # Simple unique order ID
-        order_id = int(datetime.datetime.now().timestamp()) 
+        order_id = next(_order_ids)
         order = (order_id, product_id, quantity)
         
-        if product[4] >= quantity:
+        if product.stock >= quantity:
             print("Sufficient stock. Order placed in the processing queue.")
             order_queue.append(order)
         else:
             print("Insufficient stock. Order placed in the backorder queue.")
-            # heapq is a min-heap, so we don't need to do anything special for priority
-            heapq.heappush(backorder_queue, order)
+            _push_backorder(order, _backorder_tier(quantity, product.stock))
             
     except ValueError:
         print("Invalid input. Please use numbers.")
 
+def process_next_order():
+    """Processes the next order and loads it onto the delivery truck."""
+    # Logic for processing/loading truck would go here
+    print("\nProcessing next order...")
+
+def dispatch_truck():
+    """Sends the loaded delivery truck out."""
+    # Logic for dispatching truck would go here
+    print("\nDispatching truck...")
+
+def _composite_cost_prompt():
+    """Asks for a product ID and prints its composite cost."""
+    try:
+        pid = int(input("Enter composite product ID: "))
+    except ValueError:
+        print("Invalid input. Please use numbers.")
+        return
+    cost = calculate_composite_cost(pid)
+    print(f"Calculated cost: ${cost:.2f}")
+
+def _invalid_choice():
+    """Tells the user their menu choice wasn't recognised."""
+    print("Invalid choice. Please try again.")
+
+def _exit():
+    """Says goodbye. Returns True so the caller knows to stop."""
+    print("Exiting the system. Goodbye!")
+    return True
+
 #  Main Application Loop 
 
+# Menu choice -> action. Anything that can feed in choices can drive the system through this.
+_DISPATCH = {
+    '1': generate_inventory_report,
+    '2': add_new_product,
+    '3': ledger.display_ledger,
+    '4': place_order,
+    '5': process_next_order,
+    '6': dispatch_truck,
+    # This is more of a utility, so it's lower down
+    '7': _composite_cost_prompt,
+    '8': _exit,
+}
+
+def handle(choice):
+    """Runs the action for a single menu choice. Returns True if it ends the session."""
+    return _DISPATCH.get(choice, _invalid_choice)() is True
+
+def _show_menu():
+    """Prints the main menu."""
+    print("===== Simple Inventory Management System =====")
+    # Menu options are more grouped by function
+    print("\n[INVENTORY]")
+    print("1. Generate Inventory Report")
+    print("2. Add New Product")
+    print("3. View Transaction Ledger")
+    
+    print("\n[ORDERS & DELIVERY]")
+    print("4. Place Customer Order")
+    print("5. Process Next Order & Load Truck")
+    print("6. Dispatch Truck")
+    
+    print("\n[OTHER]")
+    print("7. Calculate Composite Product Cost")
+    print("8. Exit")
+    print("============================================")
+
+def _command_source():
+    """Yields menu choices until input runs out.
+
+    At a terminal each choice is prompted for under a freshly drawn menu. When input is
+    piped in, choices are read one per line without redrawing anything, so a saved
+    session can be replayed in bulk.
+    """
+    while True:
+        prompt = ""
+        if _INTERACTIVE:
+            _clear_screen()
+            _show_menu()
+            prompt = "Enter your choice: "
+        try:
+            choice = input(prompt)
+        except EOFError:
+            return
+        yield choice
+
 def main():
     """The main function to run the command-line application."""
-    while True:
-        _clear_screen()
-        print("===== Simple Inventory Management System =====")
-        # Menu options are more grouped by function
-        print("\n[INVENTORY]")
-        print("1. Generate Inventory Report")
-        print("2. Add New Product")
-        print("3. View Transaction Ledger")
-        
-        print("\n[ORDERS & DELIVERY]")
-        print("4. Place Customer Order")
-        print("5. Process Next Order & Load Truck")
-        print("6. Dispatch Truck")
-        
-        print("\n[OTHER]")
-        print("7. Calculate Composite Product Cost")
-        print("8. Exit")
-        print("============================================")
-        
-        choice = input("Enter your choice: ")
-        
-        if choice == '1':
-            generate_inventory_report()
-            _pause()
-        elif choice == '2':
-            add_new_product()
-            _pause()
-        elif choice == '3':
-            ledger.display_ledger()
+    for choice in _command_source():
+        try:
+            if handle(choice):
+                break
             _pause()
-        elif choice == '4':
-            place_order()
-            _pause()
-        elif choice == '5':
-            # Logic for processing/loading truck would go here
-            print("\nProcessing next order...")
-            _pause()
-        elif choice == '6':
-            # Logic for dispatching truck would go here
-            print("\nDispatching truck...")
-            _pause()
-        elif choice == '7':
-            # This is more of a utility, so it's lower down
-            pid = int(input("Enter composite product ID: "))
-            cost = calculate_composite_cost(pid)
-            print(f"Calculated cost: ${cost:.2f}")
-            _pause()
-        elif choice == '8':
-            print("Exiting the system. Goodbye!")
+        except EOFError:
+            # Input ran out in the middle of a command, e.g. a replay cut short
+            print("\nInput ended before the command finished. Exiting.")
             break
-        else:
-            print("Invalid choice. Please try again.")
-            _pause()
 
 if __name__ == "__main__":
     main()